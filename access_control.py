@@ -9,7 +9,7 @@ from urllib.parse import quote
 import requests
 import urllib3
 
-from config import config
+from config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -71,11 +71,12 @@ class AccessControlService:
 
     def __init__(self, token_manager):
         self.token_manager = token_manager
-        self.base_url = config.OSDU_BASE_URL
-        self.base_host = config.OSDU_BASE_HOST
-        self.partition_id = config.OSDU_PARTITION_ID
-        self.timeout = config.OSDU_TIMEOUT_SECONDS
-        self.verify_ssl = config.as_bool(config.OSDU_VERIFY_SSL)
+        self.config = get_config()
+        self.base_url = self.config.OSDU_BASE_URL
+        self.base_host = self.config.OSDU_BASE_HOST
+        self.partition_id = self.config.OSDU_PARTITION_ID
+        self.timeout = self.config.OSDU_TIMEOUT_SECONDS
+        self.verify_ssl = self.config.OSDU_VERIFY_SSL
         self._user_groups_cache: Dict[str, Dict] = {}
         self._user_groups_cache_ttl = 180
         self._groups_cache: Dict[str, Dict] = {}
@@ -115,17 +116,17 @@ class AccessControlService:
 
     def summary(self) -> Dict:
         return {
-            "configured": bool(config.OSDU_BASE_URL and config.OSDU_TOKEN_ENDPOINT and config.OSDU_CLIENT_ID),
+            "configured": bool(self.config.OSDU_BASE_URL and self.config.OSDU_TOKEN_ENDPOINT and self.config.OSDU_CLIENT_ID),
             "token_valid": bool(self.token_manager and self.token_manager.is_token_valid()),
-            "config": config.public_summary(),
+            "config": self.config.public_summary(),
             "defaults": {
                 "partition_id": self.partition_id,
-                "group_scan_limit": config.OSDU_GROUP_SCAN_LIMIT,
+                "group_scan_limit": self.config.OSDU_GROUP_SCAN_LIMIT,
             },
         }
 
     def list_partitions(self) -> Dict:
-        path = f"{config.OSDU_PARTITION_BASE_PATH.rstrip('/')}/partitions"
+        path = f"{self.config.OSDU_PARTITION_BASE_PATH.rstrip('/')}/partitions"
         data = self._request("GET", path, partition_id=self.partition_id)
         if isinstance(data, list):
             items = data
@@ -144,14 +145,14 @@ class AccessControlService:
         return {"items": normalized}
 
     def list_users(self, search: str = "", max_items: int = 500) -> Dict:
-        if not config.OSDU_AUTH_BASE_URL or not config.OSDU_AUTH_REALM:
+        if not self.config.OSDU_AUTH_BASE_URL or not self.config.OSDU_AUTH_REALM:
             return {
                 "items": [],
                 "warning": "Keycloak admin URL is not configured; cannot list external IAM users.",
             }
 
         token = self._get_keycloak_admin_token()
-        url = f"{config.OSDU_AUTH_BASE_URL.rstrip('/')}/admin/realms/{config.OSDU_AUTH_REALM}/users"
+        url = f"{self.config.OSDU_AUTH_BASE_URL.rstrip('/')}/admin/realms/{self.config.OSDU_AUTH_REALM}/users"
         params = {
             "max": max(1, min(int(max_items or 500), 1000)),
             "briefRepresentation": "false",
@@ -364,7 +365,7 @@ class AccessControlService:
         return last_result or {"group": group, "ok": False, "status": 500, "error": "No Entitlements endpoint is configured"}
 
     def list_legal_tags(self, partition_id: Optional[str] = None) -> Dict:
-        path = f"{config.OSDU_LEGAL_BASE_PATH.rstrip('/')}/legaltags"
+        path = f"{self.config.OSDU_LEGAL_BASE_PATH.rstrip('/')}/legaltags"
         data = self._request("GET", path, partition_id=partition_id or self.partition_id)
         items = data.get("legalTags", data.get("data", data if isinstance(data, list) else []))
         return {"items": [self._normalize_legal_tag(item) for item in items]}
@@ -389,7 +390,7 @@ class AccessControlService:
         }
         data = self._request(
             "POST",
-            f"{config.OSDU_LEGAL_BASE_PATH.rstrip('/')}/legaltags",
+            f"{self.config.OSDU_LEGAL_BASE_PATH.rstrip('/')}/legaltags",
             partition_id=partition_id or self.partition_id,
             json=payload,
         )
@@ -406,7 +407,7 @@ class AccessControlService:
         encoded_name = quote(tag_name, safe="")
         data = self._request(
             "DELETE",
-            f"{config.OSDU_LEGAL_BASE_PATH.rstrip('/')}/legaltags/{encoded_name}",
+            f"{self.config.OSDU_LEGAL_BASE_PATH.rstrip('/')}/legaltags/{encoded_name}",
             partition_id=partition_id or self.partition_id,
         )
         return {
@@ -571,7 +572,7 @@ class AccessControlService:
     def _inspect_user_groups_by_scan(self, normalized_user: str, partition: str) -> Dict:
         started_at = time.time()
         groups = self.list_groups(partition).get("items", [])
-        scanned_groups = groups[: config.OSDU_GROUP_SCAN_LIMIT]
+        scanned_groups = groups[: self.config.OSDU_GROUP_SCAN_LIMIT]
         memberships: List[Dict] = []
 
         def read_group_members(group: Dict):
@@ -680,11 +681,11 @@ class AccessControlService:
 
     def get_record(self, record_id: str, partition_id: str) -> Dict:
         encoded = quote(record_id, safe="")
-        path = f"{config.OSDU_STORAGE_BASE_PATH.rstrip('/')}/records/{encoded}"
+        path = f"{self.config.OSDU_STORAGE_BASE_PATH.rstrip('/')}/records/{encoded}"
         return self._request("GET", path, partition_id=partition_id)
 
     def _entitlements_paths(self) -> List[str]:
-        configured = config.OSDU_ENTITLEMENTS_BASE_PATH.rstrip("/")
+        configured = self.config.OSDU_ENTITLEMENTS_BASE_PATH.rstrip("/")
         result = []
         for item in (configured, "/entitlements/v1"):
             if item and item not in result:
@@ -730,19 +731,19 @@ class AccessControlService:
         return []
 
     def _get_keycloak_admin_token(self) -> str:
-        if config.OSDU_EXTERNAL_ADMIN_USERNAME and config.OSDU_EXTERNAL_ADMIN_PASSWORD:
+        if self.config.OSDU_EXTERNAL_ADMIN_USERNAME and self.config.OSDU_EXTERNAL_ADMIN_PASSWORD:
             payload = {
                 "grant_type": "password",
-                "client_id": config.OSDU_CLIENT_ID,
-                "client_secret": config.OSDU_CLIENT_SECRET,
-                "username": config.OSDU_EXTERNAL_ADMIN_USERNAME,
-                "password": config.OSDU_EXTERNAL_ADMIN_PASSWORD,
+                "client_id": self.config.OSDU_CLIENT_ID,
+                "client_secret": self.config.OSDU_CLIENT_SECRET,
+                "username": self.config.OSDU_EXTERNAL_ADMIN_USERNAME,
+                "password": self.config.OSDU_EXTERNAL_ADMIN_PASSWORD,
             }
             headers = {"Content-Type": "application/x-www-form-urlencoded"}
-            if config.OSDU_TOKEN_HOST:
-                headers["Host"] = config.OSDU_TOKEN_HOST
+            if self.config.OSDU_TOKEN_HOST:
+                headers["Host"] = self.config.OSDU_TOKEN_HOST
             response = requests.post(
-                config.OSDU_TOKEN_ENDPOINT,
+                self.config.OSDU_TOKEN_ENDPOINT,
                 data=payload,
                 headers=headers,
                 timeout=self.timeout,
@@ -5,25 +5,45 @@ OSDU Record Viewer - Flask Application
 Xem các record OSDU theo domain và entities với TokenManager
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Blueprint, Flask, Response, render_template, request, jsonify, redirect, url_for
+import atexit
 import base64
 from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
+import orjson
+import signal
+import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from urllib.parse import unquote
 
-from config import config
-from token_manager import TokenManager
-from domains import DOMAINS, get_domain_info, get_entity_info
+from config import get_config
+from token_manager import get_token_manager
+from domains import DOMAINS
 from access_control import (
     ACCESS_ADMIN_GROUPS,
     DANGEROUS_GROUPS,
     AccessControlService,
     is_valid_group_email,
 )
+
+# DOMAINS is static, so counts and lookup tables only need computing once
+TOTAL_ENTITIES = sum(len(domain['entities']) for domain in DOMAINS.values())
+_DOMAIN_INDEX = dict(DOMAINS)
+_ENTITY_INDEX = {
+    (domain_name, entity_name): entity_info
+    for domain_name, domain in DOMAINS.items()
+    for entity_name, entity_info in domain['entities'].items()
+}
+
+config = get_config()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,8 +52,56 @@ logger = logging.getLogger(__name__)
 # Initialize Flask app
 app = Flask(__name__)
 
+# Shared HTTP session so OSDU calls reuse pooled keep-alive connections.
+# OSDU search and batch lookups are read-only POSTs, so POST joins the methods
+# retried on 502/503/504 (urllib3 leaves it out by default)
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+        raise_on_status=False
+    )
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Non-idempotent calls (record :delete) only retry connection failures, where
+# the request never reached OSDU; a 5xx or read error is returned as-is
+_write_session = requests.Session()
+_write_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.2, read=0, status=0)
+)
+_write_session.mount('http://', _write_adapter)
+_write_session.mount('https://', _write_adapter)
+
+# Shared worker pool for running OSDU fallback strategies concurrently
+_executor = ThreadPoolExecutor(max_workers=8)
+
+
+def close_http_resources():
+    """Close pooled OSDU connections and stop the shared worker pool."""
+    _session.close()
+    _write_session.close()
+    _executor.shutdown(wait=False)
+
+
+atexit.register(close_http_resources)
+
 token_manager = None
 admin_permission_cache = {}
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+RECORDS_CACHE_TTL = 60
+RECORDS_CACHE_MAXSIZE = 1024
+records_cache = OrderedDict()
+records_cache_lock = threading.RLock()
+records_cache_stats = {"hits": 0, "misses": 0}
 PUBLIC_ENDPOINTS = {
     'connect_page',
     'auth_page',
@@ -68,6 +136,7 @@ def clear_auth_state():
         token_manager.stop_background_refresh()
     token_manager = None
     admin_permission_cache = {}
+    clear_records_cache()
     osdu_service = OSDUService()
     access_control_service = AccessControlService(token_manager)
 
@@ -86,7 +155,8 @@ def rebuild_token_manager(prewarm: bool = True):
         token_manager.stop_background_refresh()
 
     config.validate()
-    token_manager = TokenManager(config.to_dict())
+    clear_records_cache()
+    token_manager = get_token_manager(config.to_dict)
     if prewarm:
         token_manager.prewarm()
         token_manager.start_background_refresh(interval=3000)
@@ -215,6 +285,52 @@ def current_user_has_access_admin_permission(partition_id: str) -> bool:
     return allowed
 
 
+def get_cached_records(cache_key) -> Optional[Dict]:
+    """Return a cached records page, or None when missing or expired."""
+    with records_cache_lock:
+        cached = records_cache.get(cache_key)
+        if cached and time.time() - cached["created_at"] < RECORDS_CACHE_TTL:
+            records_cache.move_to_end(cache_key)
+            records_cache_stats["hits"] += 1
+            return cached["payload"]
+        if cached:
+            records_cache.pop(cache_key, None)
+        records_cache_stats["misses"] += 1
+        return None
+
+
+def cache_records(cache_key, payload: Dict):
+    """Store a records page, evicting the least recently used entries."""
+    with records_cache_lock:
+        records_cache[cache_key] = {"created_at": time.time(), "payload": payload}
+        records_cache.move_to_end(cache_key)
+        while len(records_cache) > RECORDS_CACHE_MAXSIZE:
+            records_cache.popitem(last=False)
+
+
+def clear_records_cache():
+    """Drop every cached records page (auth, partition or data changed)."""
+    with records_cache_lock:
+        records_cache.clear()
+
+
+def records_cache_info() -> Dict:
+    """Return records cache size and hit/miss counters for health checks."""
+    with records_cache_lock:
+        return {
+            "size": len(records_cache),
+            "maxsize": RECORDS_CACHE_MAXSIZE,
+            "ttl": RECORDS_CACHE_TTL,
+            "hits": records_cache_stats["hits"],
+            "misses": records_cache_stats["misses"],
+        }
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """Serialize an API payload with orjson instead of the stdlib encoder."""
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), status=status, mimetype='application/json')
+
+
 def is_current_caller(target_email: str) -> bool:
     normalized_target = (target_email or "").strip().lower()
     return bool(normalized_target and normalized_target in current_caller_identity_candidates())
@@ -238,74 +354,141 @@ class OSDUService:
         self.base_url = config.OSDU_BASE_URL
         self.base_host = config.OSDU_BASE_HOST  # Host header bypass
         self.partition_id = config.OSDU_PARTITION_ID
-
-    def get_headers(self, accept_json: bool = True) -> Dict[str, str]:
-        """Get headers with access token and Host bypass"""
+        self.timeout = (3.05, config.OSDU_TIMEOUT_SECONDS)
+        self.session = _session
+        self.write_session = _write_session
+        # Static headers are built once per instance; the shared session is never
+        # mutated, since other threads may be sending on it
+        static_headers = {
+            "data-partition-id": self.partition_id,
+            "Content-Type": "application/json",
+        }
+        if self.base_host:
+            static_headers["Host"] = self.base_host
+            logger.debug("Using Host header: %s for OSDU API", self.base_host)
+        self._static_headers = MappingProxyType(static_headers)
+        self._headers_cache = (None, None, None)  # (token, json headers, plain headers)
+
+    def get_headers(self, accept_json: bool = True) -> Mapping[str, str]:
+        """Get per-request auth headers, reusing them until the token rotates"""
+        return self._headers_for(self._current_token(), accept_json)
+
+    @staticmethod
+    def _current_token() -> str:
         if not token_manager:
             raise Exception("TokenManager not initialized")
         
         try:
-            token = token_manager.get_token()
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "data-partition-id": self.partition_id,
-                "Content-Type": "application/json"
-            }
-            
-            if accept_json:
-                headers["Accept"] = "application/json"
-            
-            if self.base_host:
-                headers["Host"] = self.base_host
-                logger.debug(f"Using Host header: {self.base_host} for OSDU API")
-                
-            return headers
-            
+            return token_manager.get_token()
         except Exception as e:
-            logger.error(f"Failed to get token: {e}")
+            logger.error("Failed to get token: %s", e)
             raise Exception(f"Authentication failed: {e}")
 
+    def _headers_for(self, token: str, accept_json: bool = True) -> Mapping[str, str]:
+        cached = self._headers_cache
+        if cached[0] != token:
+            plain_headers = {"Authorization": f"Bearer {token}", **self._static_headers}
+            json_headers = {**plain_headers, "Accept": "application/json"}
+            cached = (token, MappingProxyType(json_headers), MappingProxyType(plain_headers))
+            self._headers_cache = cached
+        return cached[1] if accept_json else cached[2]
+
+    def request_headers(self) -> Dict[str, str]:
+        """Full header set sent to OSDU, for debug output"""
+        return dict(self.get_headers())
+
+    def _request(self, method: str, url: str, idempotent: bool = True, **kwargs) -> requests.Response:
+        """Send an OSDU request, refreshing the token and retrying once on 401.
+
+        Pass ``idempotent=False`` for calls that change data, so they go through
+        the session that does not retry on 5xx or read errors.
+        """
+        session = self.session if idempotent else self.write_session
+        kwargs.setdefault('timeout', self.timeout)
+        token = self._current_token()
+        response = session.request(method, url, headers=self._headers_for(token), **kwargs)
+        if response.status_code == 401 and token_manager:
+            # Token might be expired: drop it unless a concurrent request already
+            # refreshed it, then retry once with the current token
+            logger.warning("Token expired, attempting refresh")
+            token_manager.invalidate(token)
+            response = session.request(method, url, headers=self.get_headers(), **kwargs)
+        return response
+
     def search_records(self, kind: str, limit: int = 50, offset: int = 0, 
-                      returned_fields: Optional[List[str]] = None, try_alternatives: bool = True) -> Dict:
+                      returned_fields: Optional[List[str]] = None, try_alternatives: bool = True,
+                      parallel: bool = True) -> Dict:
         """Search records by kind with fallback strategies"""
+        has_wks = ':wks:' in kind
+        entity_name = kind.split('--')[-1].split(':')[0] if '--' in kind else None
         
-        # Strategy 1: Try primary kind
-        result = self._try_search_with_kind(kind, limit, offset, returned_fields)
+        # Strategy 1: Try primary kind; with no usable alternative, it is the only call
+        if not try_alternatives or (not has_wks and not entity_name):
+            return self._try_search_with_kind(kind, limit, offset, returned_fields)
         
-        if not result.get('error'):
-            return result
-            
-        if not try_alternatives:
-            return result
-            
-        logger.warning(f"Primary search failed, trying alternatives...")
+        strategies = [(self._try_search_with_kind, (kind, limit, offset, returned_fields))]
         
         # Strategy 2: Try ddms-wellbore domain if using wks
-        if ':wks:' in kind:
+        if has_wks:
             alt_kind = kind.replace(':wks:', ':ddms-wellbore:')
-            logger.info(f"Trying ddms-wellbore: {alt_kind}")
-            alt_result = self._try_search_with_kind(alt_kind, limit, offset, returned_fields)
-            if not alt_result.get('error'):
-                return alt_result
+            strategies.append((self._try_search_with_kind, (alt_kind, limit, offset, returned_fields)))
         
         # Strategy 3: Try wildcard search with entity name
-        entity_name = kind.split('--')[-1].split(':')[0] if '--' in kind else None
-        if entity_name:
-            wild_kind = f"*{entity_name}*"
-            logger.info(f"Trying wildcard search: {wild_kind}")
-            wildcard_result = self._try_search_with_query(wild_kind, limit, offset)
-            if not wildcard_result.get('error'):
-                return wildcard_result
-                
         # Strategy 4: Try general query search
         if entity_name:
-            logger.info(f"Trying general query search for: {entity_name}")
-            query_result = self._try_search_with_query(f"kind:*{entity_name}*", limit, offset)
-            if not query_result.get('error'):
-                return query_result
+            strategies.append((self._try_search_with_query, (f"*{entity_name}*", limit, offset)))
+            strategies.append((self._try_search_with_query, (f"kind:*{entity_name}*", limit, offset)))
+        
+        index, results = self._first_successful(strategies, parallel=parallel)
+        if index is not None:
+            if index > 0:
+                logger.warning("Primary search failed, using alternative strategy %s", index + 1)
+            return results[index]
         
         # All strategies failed, return original error
-        return result
+        return results[0]
+
+    @staticmethod
+    def _run_strategy(func, args) -> Dict:
+        try:
+            return func(*args)
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _first_successful(self, strategies: List, parallel: bool = True):
+        """Run (func, args) strategies and return (index, results) for the first success.
+
+        Strategies keep their priority order: a lower-priority success is only
+        used after every higher-priority strategy has failed. With ``parallel``
+        the primary strategy runs on the calling thread while the alternatives
+        run on the shared executor, so a healthy primary never waits for a pool
+        worker. ``index`` is None when every strategy failed; a strategy that
+        raises is recorded as an error result.
+        """
+        results = [None] * len(strategies)
+        
+        if not parallel or len(strategies) == 1:
+            for i, (func, args) in enumerate(strategies):
+                results[i] = self._run_strategy(func, args)
+                if not results[i].get('error'):
+                    return i, results
+            return None, results
+        
+        futures = [_executor.submit(self._run_strategy, func, args) for func, args in strategies[1:]]
+        try:
+            results[0] = self._run_strategy(*strategies[0])
+            if not results[0].get('error'):
+                return 0, results
+            for i, future in enumerate(futures, start=1):
+                results[i] = future.result()
+                if not results[i].get('error'):
+                    return i, results
+        finally:
+            # Drops alternatives still queued; ones already running finish on their own
+            for future in futures:
+                future.cancel()
+        
+        return None, results
 
     def _try_search_with_kind(self, kind: str, limit: int = 50, offset: int = 0, 
                              returned_fields: Optional[List[str]] = None) -> Dict:
@@ -334,29 +517,18 @@ class OSDUService:
         # Search records
         try:
             # Log request details for debugging
-            logger.info(f"Making search request to: {url}")
-            logger.info(f"Kind: {kind}")
-            logger.info(f"Payload: {json.dumps(payload, indent=2)}")
+            logger.info("Making search request to: %s", url)
+            logger.info("Kind: %s", kind)
+            logger.debug("Payload: %s", payload)
             
-            response = requests.post(url, headers=self.get_headers(), json=payload)
+            response = self._request("POST", url, json=payload)
             response.raise_for_status()
             
             result = response.json()
-            logger.info(f"Search completed: {len(result.get('results', []))} records found")
+            logger.info("Search completed: %s records found", len(result.get('results', [])))
             return result
             
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                # Token might be expired, try to refresh
-                logger.warning("Token expired, attempting refresh")
-                token_manager.clear_cache()
-                try:
-                    response = requests.post(url, headers=self.get_headers(), json=payload)
-                    response.raise_for_status()
-                    return response.json()
-                except:
-                    pass
-            
             # Log detailed error information
             error_detail = ""
             try:
@@ -364,17 +536,18 @@ class OSDUService:
             except:
                 error_detail = "Could not read response"
             
-            logger.error(f"HTTP error searching records: {e}")
-            logger.error(f"Status: {response.status_code}")
-            logger.error(f"URL: {url}")
-            logger.error(f"Payload: {json.dumps(payload, indent=2)}")
-            logger.error(f"Headers: {mask_headers(self.get_headers())}")
-            logger.error(f"Response: {error_detail}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("HTTP error searching records: %s", e)
+                logger.error("Status: %s", response.status_code)
+                logger.error("URL: %s", url)
+                logger.error("Payload: %s", payload)
+                logger.error("Headers: %s", mask_headers(self.request_headers()))
+                logger.error("Response: %s", error_detail)
             
             return {"error": f"API request failed: {response.status_code} - {error_detail[:100]}", "results": []}
             
         except Exception as e:
-            logger.error(f"Error searching records: {e}")
+            logger.error("Error searching records: %s", e)
             return {"error": str(e), "results": []}
 
     def _try_search_with_query(self, query: str, limit: int = 50, offset: int = 0) -> Dict:
@@ -389,14 +562,14 @@ class OSDUService:
         }
         
         try:
-            logger.info(f"Making query search request: {query}")
-            logger.info(f"Payload: {json.dumps(payload, indent=2)}")
+            logger.info("Making query search request: %s", query)
+            logger.debug("Payload: %s", payload)
             
-            response = requests.post(url, headers=self.get_headers(), json=payload)
+            response = self._request("POST", url, json=payload)
             response.raise_for_status()
             
             result = response.json()
-            logger.info(f"Query search completed: {len(result.get('results', []))} records found")
+            logger.info("Query search completed: %s records found", len(result.get('results', [])))
             return result
             
         except requests.exceptions.HTTPError as e:
@@ -406,17 +579,17 @@ class OSDUService:
             except:
                 error_detail = "Could not read response"
             
-            logger.error(f"HTTP error in query search: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Response: {error_detail}")
+            logger.error("HTTP error in query search: %s", e)
+            logger.error("Query: %s", query)
+            logger.error("Response: %s", error_detail)
             
             return {"error": f"Query search failed: {response.status_code} - {error_detail[:100]}", "results": []}
             
         except Exception as e:
-            logger.error(f"Error in query search: {e}")
+            logger.error("Error in query search: %s", e)
             return {"error": str(e), "results": []}
 
-    def get_record_details(self, record_ids: List[str]) -> Dict:
+    def get_record_details(self, record_ids: List[str], parallel: bool = True) -> Dict:
         """Get record details by IDs with multiple endpoint strategies"""
         
         if not record_ids:
@@ -424,25 +597,21 @@ class OSDUService:
             
         record_id = record_ids[0]  # Focus on single record first
         
-        # Strategy 1: Try individual record endpoint
-        result = self._try_get_record_by_id(record_id)
-        if not result.get('error'):
-            return {"records": [result]}
-            
-        # Strategy 2: Try batch endpoint with different format
-        result = self._try_batch_records_v1(record_ids)
-        if not result.get('error'):
-            return result
-            
-        # Strategy 3: Try batch endpoint v2 with different method
-        result = self._try_batch_records_v2(record_ids)
-        if not result.get('error'):
-            return result
-            
-        # Strategy 4: Use search to get full record instead
-        result = self._try_get_record_via_search(record_id)
-        if not result.get('error'):
-            return {"records": [result]}
+        index, results = self._first_successful([
+            # Strategy 1: Try individual record endpoint
+            (self._try_get_record_by_id, (record_id,)),
+            # Strategy 2: Try batch endpoint with different format
+            (self._try_batch_records_v1, (record_ids,)),
+            # Strategy 3: Try batch endpoint v2 with different method
+            (self._try_batch_records_v2, (record_ids,)),
+            # Strategy 4: Use search to get full record instead
+            (self._try_get_record_via_search, (record_id,)),
+        ], parallel=parallel)
+        
+        if index in (0, 3):
+            return {"records": [results[index]]}
+        if index is not None:
+            return results[index]
             
         return {"error": "Could not retrieve record details", "records": []}
 
@@ -451,16 +620,16 @@ class OSDUService:
         url = f"{self.base_url}/api/storage/v2/records/{record_id}"
         
         try:
-            logger.info(f"Trying individual record endpoint: {url}")
-            response = requests.get(url, headers=self.get_headers())
+            logger.info("Trying individual record endpoint: %s", url)
+            response = self._request("GET", url)
             response.raise_for_status()
             
             result = response.json()
-            logger.info(f"Successfully retrieved record via individual endpoint")
+            logger.info("Successfully retrieved record via individual endpoint")
             return result
             
         except Exception as e:
-            logger.warning(f"Individual record endpoint failed: {e}")
+            logger.warning("Individual record endpoint failed: %s", e)
             return {"error": str(e)}
 
     def _try_batch_records_v1(self, record_ids: List[str]) -> Dict:
@@ -472,16 +641,16 @@ class OSDUService:
         }
         
         try:
-            logger.info(f"Trying batch records v1: {url}")
-            response = requests.post(url, headers=self.get_headers(), json=payload)
+            logger.info("Trying batch records v1: %s", url)
+            response = self._request("POST", url, json=payload)
             response.raise_for_status()
             
             result = response.json()
-            logger.info(f"Successfully retrieved records via batch v1")
+            logger.info("Successfully retrieved records via batch v1")
             return result
             
         except Exception as e:
-            logger.warning(f"Batch records v1 failed: {e}")
+            logger.warning("Batch records v1 failed: %s", e)
             return {"error": str(e)}
     
     def _try_batch_records_v2(self, record_ids: List[str]) -> Dict:
@@ -493,16 +662,16 @@ class OSDUService:
         }
         
         try:
-            logger.info(f"Trying batch records v2: {url}")
-            response = requests.post(url, headers=self.get_headers(), json=payload)
+            logger.info("Trying batch records v2: %s", url)
+            response = self._request("POST", url, json=payload)
             response.raise_for_status()
             
             result = response.json()
-            logger.info(f"Successfully retrieved records via batch v2")
+            logger.info("Successfully retrieved records via batch v2")
             return result
             
         except Exception as e:
-            logger.warning(f"Batch records v2 failed: {e}")
+            logger.warning("Batch records v2 failed: %s", e)
             return {"error": str(e)}
     
     def _try_get_record_via_search(self, record_id: str) -> Dict:
@@ -517,21 +686,21 @@ class OSDUService:
         }
         
         try:
-            logger.info(f"Trying to get record via search: {record_id}")
-            response = requests.post(url, headers=self.get_headers(), json=payload)
+            logger.info("Trying to get record via search: %s", record_id)
+            response = self._request("POST", url, json=payload)
             response.raise_for_status()
             
             result = response.json()
             records = result.get('results', [])
             
             if records:
-                logger.info(f"Successfully retrieved record via search")
+                logger.info("Successfully retrieved record via search")
                 return records[0]
             else:
                 return {"error": "Record not found in search results"}
             
         except Exception as e:
-            logger.warning(f"Search-based record retrieval failed: {e}")
+            logger.warning("Search-based record retrieval failed: %s", e)
             return {"error": str(e)}
 
     def delete_record(self, record_id: str) -> Dict:
@@ -540,7 +709,7 @@ class OSDUService:
         
         try:
             logger.info(f"Deleting record: {record_id}")
-            response = requests.post(url, headers=self.get_headers(), timeout=600)
+            response = self._request("POST", url, idempotent=False, timeout=(3.05, 600))
             response.raise_for_status()
             
             logger.info(f"Successfully deleted record: {record_id}")
@@ -580,7 +749,7 @@ class OSDUService:
             
             try:
                 logger.info(f"Deleting record {success_count + failed_count + 1}/{len(record_ids)}: {record_id}")
-                response = requests.post(url, headers=self.get_headers(), timeout=600)
+                response = self._request("POST", url, idempotent=False, timeout=(3.05, 600))
                 response.raise_for_status()
                 success_count += 1
                 logger.info(f"Successfully deleted: {record_id}")
@@ -639,12 +808,6 @@ osdu_service = OSDUService()
 access_control_service = AccessControlService(token_manager)
 
 
-# Helper functions
-def calculate_total_entities():
-    """Calculate total number of entities across all domains"""
-    return sum(len(domain['entities']) for domain in DOMAINS.values())
-
-
 # Routes
 @app.before_request
 def require_auth_for_ui_routes():
@@ -690,10 +853,9 @@ def home_alias():
 @app.route('/catalog')
 def catalog_page():
     """Data Catalog dashboard showing all domains."""
-    total_entities = calculate_total_entities()
     return render_template('catalog.html',
                          domains=DOMAINS, 
-                         total_entities=total_entities)
+                         total_entities=TOTAL_ENTITIES)
 
 
 @app.route('/data-catalog')
@@ -705,7 +867,7 @@ def data_catalog_page():
 def domain_page(domain_name):
     """Domain page showing entities"""
     domain_name = unquote(domain_name)
-    domain_info = get_domain_info(domain_name)
+    domain_info = _DOMAIN_INDEX.get(domain_name)
     
     if not domain_info:
         return f"Domain '{domain_name}' not found", 404
@@ -727,11 +889,11 @@ def records_page(domain_name, entity_name):
     domain_name = unquote(domain_name)
     entity_name = unquote(entity_name)
     
-    domain_info = get_domain_info(domain_name)
+    domain_info = _DOMAIN_INDEX.get(domain_name)
     if not domain_info:
         return f"Domain '{domain_name}' not found", 404
     
-    entity_info = get_entity_info(domain_name, entity_name)
+    entity_info = _ENTITY_INDEX.get((domain_name, entity_name))
     if not entity_info:
         return f"Entity '{entity_name}' not found in domain '{domain_name}'", 404
     
@@ -839,18 +1001,18 @@ def inject_auth_state():
 def api_records(domain_name, entity_name):
     """API endpoint to get records for an entity"""
     if not osdu_auth_ready(refresh=True):
-        return jsonify({"error": "OSDU access token is not configured or not valid"}), 401
+        return json_response({"error": "OSDU access token is not configured or not valid"}), 401
     domain_name = unquote(domain_name)
     entity_name = unquote(entity_name)
     
     # Validate inputs
-    domain_info = get_domain_info(domain_name)
+    domain_info = _DOMAIN_INDEX.get(domain_name)
     if not domain_info:
-        return jsonify({"error": f"Domain '{domain_name}' not found"}), 404
+        return json_response({"error": f"Domain '{domain_name}' not found"}), 404
     
-    entity_info = get_entity_info(domain_name, entity_name)
+    entity_info = _ENTITY_INDEX.get((domain_name, entity_name))
     if not entity_info:
-        return jsonify({"error": f"Entity '{entity_name}' not found"}), 404
+        return json_response({"error": f"Entity '{entity_name}' not found"}), 404
     
     # Get parameters
     limit = min(int(request.args.get('limit', 50)), 1000)
@@ -872,42 +1034,62 @@ def api_records(domain_name, entity_name):
         # Default: return full data for better UX
         returned_fields = ["id", "kind", "data"]
     
+    # Serve repeat pages from the in-process cache unless ?nocache=1. The key
+    # names the service's partition and base URL, so a request still in flight
+    # across a rebuild_token_manager cannot refill the cache with the old data
+    service = osdu_service
+    use_cache = request.args.get('nocache') != '1'
+    cache_key = (
+        service.partition_id,
+        service.base_url,
+        entity_info['kind'],
+        limit,
+        offset,
+        tuple(returned_fields) if returned_fields else None,
+    )
+    if use_cache:
+        cached = get_cached_records(cache_key)
+        if cached is not None:
+            return json_response(cached)
+    
     # Search records
     try:
-        result = osdu_service.search_records(
+        result = service.search_records(
             entity_info['kind'], 
             limit, 
             offset, 
             returned_fields
         )
         
-        # Add some metadata
+        # Add some metadata once at the response root rather than per record
         if 'results' in result:
-            for record in result['results']:
-                record['_entity'] = entity_name
-                record['_domain'] = domain_name
+            result['_entity'] = entity_name
+            result['_domain'] = domain_name
         
-        return jsonify(result)
+        if not result.get('error'):
+            cache_records(cache_key, result)
+        
+        return json_response(result)
         
     except Exception as e:
         logger.error(f"Error in api_records: {e}")
-        return jsonify({"error": str(e), "results": []}), 500
+        return json_response({"error": str(e), "results": []}), 500
 
 
 @app.route('/api/record/<path:record_id>')
 def api_record_detail(record_id):
     """API endpoint to get record details"""
     if not osdu_auth_ready(refresh=True):
-        return jsonify({"error": "OSDU access token is not configured or not valid", "records": []}), 401
+        return json_response({"error": "OSDU access token is not configured or not valid", "records": []}), 401
     record_id = unquote(record_id)
     
     try:
         result = osdu_service.get_record_details([record_id])
-        return jsonify(result)
+        return json_response(result)
         
     except Exception as e:
         logger.error(f"Error in api_record_detail: {e}")
-        return jsonify({"error": str(e), "records": []}), 500
+        return json_response({"error": str(e), "records": []}), 500
 
 
 @app.route('/api/delete-record/<path:record_id>', methods=['POST'])
@@ -920,6 +1102,7 @@ def api_delete_record(record_id):
     try:
         result = osdu_service.delete_record(record_id)
         if result.get('success'):
+            clear_records_cache()
             return jsonify(result), 200
         else:
             return jsonify(result), 400
@@ -947,6 +1130,7 @@ def api_bulk_delete_records():
         result = osdu_service.bulk_delete_records(record_ids)
         
         if result.get('success'):
+            clear_records_cache()
             return jsonify(result), 200
         else:
             return jsonify(result), 400
@@ -963,7 +1147,7 @@ def api_health():
         # Check token validity
         is_token_valid = token_manager and token_manager.is_token_valid()
         
-        return jsonify({
+        return json_response({
             "status": "healthy",
             "token_manager": "initialized" if token_manager else "not_initialized",
             "token_valid": is_token_valid,
@@ -971,11 +1155,12 @@ def api_health():
             "partition_id": config.OSDU_PARTITION_ID,
             "token_grant_type": config.OSDU_TOKEN_GRANT_TYPE,
             "domains": len(DOMAINS),
-            "entities": calculate_total_entities()
+            "entities": TOTAL_ENTITIES,
+            "records_cache": records_cache_info()
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "status": "error",
             "error": str(e)
         }), 500
@@ -1425,7 +1610,11 @@ def api_access_control_check():
         return jsonify({"error": str(e)}), 500
 
 
-@app.route('/api/debug/test-search')
+# Debug routes: only registered when Flask DEBUG is enabled
+debug_bp = Blueprint('debug', __name__, url_prefix='/api/debug')
+
+
+@debug_bp.route('/test-search')
 def api_debug_test_search():
     """Debug endpoint to test OSDU search API"""
     try:
@@ -1437,40 +1626,39 @@ def api_debug_test_search():
             "*Basin*"
         ]
         
-        results = {}
+        url = f"{osdu_service.base_url}/api/search/v2/query"
+        headers = osdu_service.get_headers()
         
-        for kind in test_kinds:
-            url = f"{osdu_service.base_url}/api/search/v2/query"
-            
+        def probe(kind: str) -> Dict:
             payload = {
                 "kind": kind,
                 "limit": 1,
                 "offset": 0
             }
             
-            headers = osdu_service.get_headers()
-            
-            logger.info(f"Testing search with kind: {kind}")
+            logger.info("Testing search with kind: %s", kind)
             
             try:
-                response = requests.post(url, headers=headers, json=payload)
+                response = osdu_service.session.post(url, headers=headers, json=payload, timeout=osdu_service.timeout)
                 
-                results[kind] = {
+                return {
                     "status_code": response.status_code,
                     "response_text": response.text[:200] + "..." if len(response.text) > 200 else response.text,
                     "success": response.status_code == 200
                 }
                 
             except Exception as e:
-                results[kind] = {
+                return {
                     "error": str(e),
                     "success": False
                 }
         
-        return jsonify({
+        results = dict(zip(test_kinds, _executor.map(probe, test_kinds)))
+        
+        return json_response({
             "test_results": results,
             "request_url": url,
-            "request_headers": mask_headers(osdu_service.get_headers()),
+            "request_headers": mask_headers(headers),
             "base_config": {
                 "base_url": config.OSDU_BASE_URL,
                 "partition_id": config.OSDU_PARTITION_ID
@@ -1478,72 +1666,60 @@ def api_debug_test_search():
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "error": str(e)
         }), 500
 
 
-@app.route('/api/debug/test-record-retrieval/<path:record_id>')
+@debug_bp.route('/test-record-retrieval/<path:record_id>')
 def api_debug_test_record_retrieval(record_id):
     """Debug endpoint to test record retrieval strategies"""
     try:
-        from urllib.parse import unquote
         record_id = unquote(record_id)
         
-        strategies = []
-        
-        # Strategy 1: Individual record endpoint
-        result1 = osdu_service._try_get_record_by_id(record_id)
-        strategies.append({
-            "name": "Individual Record GET",
-            "url": f"/api/storage/v2/records/{record_id}",
-            "method": "GET",
-            "success": not result1.get('error'),
-            "error": result1.get('error', None)
-        })
+        probes = [
+            ({
+                "name": "Individual Record GET",
+                "url": f"/api/storage/v2/records/{record_id}",
+                "method": "GET"
+            }, osdu_service._try_get_record_by_id, record_id),
+            ({
+                "name": "Batch Records V1",
+                "url": "/api/storage/v2/records",
+                "method": "POST",
+                "payload": {"recordIds": [record_id]}
+            }, osdu_service._try_batch_records_v1, [record_id]),
+            ({
+                "name": "Batch Records V2",
+                "url": "/api/storage/v2/query/records", 
+                "method": "POST",
+                "payload": {"records": [record_id]}
+            }, osdu_service._try_batch_records_v2, [record_id]),
+            ({
+                "name": "Search-Based Retrieval",
+                "url": "/api/search/v2/query",
+                "method": "POST", 
+                "payload": {"query": f"id:{record_id}", "limit": 1, "returnedFields": ["*"]}
+            }, osdu_service._try_get_record_via_search, record_id),
+        ]
         
-        # Strategy 2: Batch v1
-        result2 = osdu_service._try_batch_records_v1([record_id])
-        strategies.append({
-            "name": "Batch Records V1",
-            "url": "/api/storage/v2/records",
-            "method": "POST",
-            "payload": {"recordIds": [record_id]},
-            "success": not result2.get('error'),
-            "error": result2.get('error', None)
-        })
+        results = list(_executor.map(lambda probe: probe[1](probe[2]), probes))
         
-        # Strategy 3: Batch v2  
-        result3 = osdu_service._try_batch_records_v2([record_id])
-        strategies.append({
-            "name": "Batch Records V2",
-            "url": "/api/storage/v2/query/records", 
-            "method": "POST",
-            "payload": {"records": [record_id]},
-            "success": not result3.get('error'),
-            "error": result3.get('error', None)
-        })
-        
-        # Strategy 4: Search-based
-        result4 = osdu_service._try_get_record_via_search(record_id)
-        strategies.append({
-            "name": "Search-Based Retrieval",
-            "url": "/api/search/v2/query",
-            "method": "POST", 
-            "payload": {"query": f"id:{record_id}", "limit": 1, "returnedFields": ["*"]},
-            "success": not result4.get('error'),
-            "error": result4.get('error', None)
-        })
+        strategies = []
+        for (strategy, _, _), result in zip(probes, results):
+            strategies.append({
+                **strategy,
+                "success": not result.get('error'),
+                "error": result.get('error', None)
+            })
         
         # Find the first successful strategy
-        successful_result = None
-        for i, strategy in enumerate(strategies):
-            if strategy['success']:
-                results = [result1, result2, result3, result4]
-                successful_result = results[i]
-                break
+        successful_result = next(
+            (result for strategy, result in zip(strategies, results) if strategy['success']),
+            None
+        )
         
-        return jsonify({
+        return json_response({
             "record_id": record_id,
             "strategies": strategies,
             "summary": {
@@ -1551,78 +1727,49 @@ def api_debug_test_record_retrieval(record_id):
                 "successful": len([s for s in strategies if s['success']]),
                 "failed": len([s for s in strategies if not s['success']])
             },
-            "successful_data": successful_result if successful_result and not successful_result.get('error') else None
+            "successful_data": successful_result
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "error": str(e)
         }), 500
 
 
-@app.route('/api/debug/test-all-strategies')
+@debug_bp.route('/test-all-strategies')
 def api_debug_test_all_strategies():
     """Debug endpoint to test all search strategies"""
     try:
-        entity_name = "Basin"
-        strategies = []
-        
-        # Strategy 1: wks domain
-        kind1 = "osdu:wks:master-data--Basin:*"
-        result1 = osdu_service._try_search_with_kind(kind1, 1, 0, ["id", "kind"])
-        strategies.append({
-            "name": "WKS Domain",
-            "kind": kind1,
-            "success": not result1.get('error'),
-            "error": result1.get('error', ''),
-            "count": len(result1.get('results', []))
-        })
-        
-        # Strategy 2: ddms-wellbore domain  
-        kind2 = "osdu:ddms-wellbore:master-data--Basin:*"
-        result2 = osdu_service._try_search_with_kind(kind2, 1, 0, ["id", "kind"])
-        strategies.append({
-            "name": "DDMS-Wellbore Domain",
-            "kind": kind2,
-            "success": not result2.get('error'),
-            "error": result2.get('error', ''),
-            "count": len(result2.get('results', []))
-        })
+        probes = [
+            # Strategy 1: wks domain
+            ({"name": "WKS Domain", "kind": "osdu:wks:master-data--Basin:*"},
+             osdu_service._try_search_with_kind, ("osdu:wks:master-data--Basin:*", 1, 0, ["id", "kind"])),
+            # Strategy 2: ddms-wellbore domain
+            ({"name": "DDMS-Wellbore Domain", "kind": "osdu:ddms-wellbore:master-data--Basin:*"},
+             osdu_service._try_search_with_kind, ("osdu:ddms-wellbore:master-data--Basin:*", 1, 0, ["id", "kind"])),
+            # Strategy 3: Wildcard query
+            ({"name": "Wildcard Query", "query": "*Basin*"},
+             osdu_service._try_search_with_query, ("*Basin*", 1, 0)),
+            # Strategy 4: Kind query
+            ({"name": "Kind Query", "query": "kind:*Basin*"},
+             osdu_service._try_search_with_query, ("kind:*Basin*", 1, 0)),
+            # Strategy 5: General search
+            ({"name": "General Search (5 records)", "query": "*"},
+             osdu_service._try_search_with_query, ("*", 5, 0)),
+        ]
         
-        # Strategy 3: Wildcard query
-        query1 = "*Basin*"
-        result3 = osdu_service._try_search_with_query(query1, 1, 0)
-        strategies.append({
-            "name": "Wildcard Query",
-            "query": query1,
-            "success": not result3.get('error'),
-            "error": result3.get('error', ''),
-            "count": len(result3.get('results', []))
-        })
+        results = _executor.map(lambda probe: probe[1](*probe[2]), probes)
         
-        # Strategy 4: Kind query
-        query2 = "kind:*Basin*"
-        result4 = osdu_service._try_search_with_query(query2, 1, 0)
-        strategies.append({
-            "name": "Kind Query",
-            "query": query2,
-            "success": not result4.get('error'),
-            "error": result4.get('error', ''),
-            "count": len(result4.get('results', []))
-        })
-        
-        # Strategy 5: General search
-        query3 = "*"
-        result5 = osdu_service._try_search_with_query(query3, 5, 0)
-        strategies.append({
-            "name": "General Search (5 records)",
-            "query": query3,
-            "success": not result5.get('error'),
-            "error": result5.get('error', ''),
-            "count": len(result5.get('results', []))
-        })
+        strategies = []
+        for (strategy, _, _), result in zip(probes, results):
+            strategies.append({
+                **strategy,
+                "success": not result.get('error'),
+                "error": result.get('error', ''),
+                "count": len(result.get('results', []))
+            })
         
-        return jsonify({
+        return json_response({
             "strategies": strategies,
             "summary": {
                 "total_strategies": len(strategies),
@@ -1632,12 +1779,12 @@ def api_debug_test_all_strategies():
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "error": str(e)
         }), 500
 
 
-@app.route('/api/debug/simple-search')
+@debug_bp.route('/simple-search')
 def api_debug_simple_search():
     """Very simple search test"""
     try:
@@ -1650,9 +1797,9 @@ def api_debug_simple_search():
         }
         
         headers = osdu_service.get_headers()
-        response = requests.post(url, headers=headers, json=payload)
+        response = osdu_service.session.post(url, headers=headers, json=payload, timeout=osdu_service.timeout)
         
-        return jsonify({
+        return json_response({
             "status_code": response.status_code,
             "headers": dict(response.headers),
             "response_text": response.text,
@@ -1660,11 +1807,15 @@ def api_debug_simple_search():
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "error": str(e)
         }), 500
 
 
+if config.get_flask_config['DEBUG']:
+    app.register_blueprint(debug_bp)
+
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
@@ -1682,7 +1833,7 @@ if __name__ == '__main__':
     print(f"📍 Base URL: {config.OSDU_BASE_URL}")
     print(f"📊 Partition: {config.OSDU_PARTITION_ID}")
     print(f"🏗️  Domains: {len(DOMAINS)}")
-    print(f"📋 Entities: {calculate_total_entities()}")
+    print(f"📋 Entities: {TOTAL_ENTITIES}")
     print("=" * 60)
     
     if not token_manager:
@@ -1699,8 +1850,11 @@ if __name__ == '__main__':
     print(f"🌐 URL: http://{config.FLASK_HOST}:{config.FLASK_PORT}")
     print("=" * 60)
     
+    # gunicorn installs its own graceful SIGTERM handling; only the dev server needs this
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    
     try:
-        flask_config = config.get_flask_config()
+        flask_config = config.get_flask_config
         app.run(
             host=flask_config['HOST'],
             port=flask_config['PORT'],
@@ -1,23 +1,75 @@
 """Configuration management for the OSDU web console."""
 import os
+from functools import lru_cache
+from operator import attrgetter
 from dotenv import load_dotenv
 from pathlib import Path
+from types import MappingProxyType
+
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'y', 'on'})
+
+_ENV_PATH = Path(__file__).resolve().parent / '.env'
+
+_BASE_REQUIRED_FIELDS = ('OSDU_BASE_URL', 'OSDU_PARTITION_ID', 'OSDU_TOKEN_ENDPOINT', 'OSDU_CLIENT_ID')
+
+# Required fields per grant type, with a getter that reads them all in one call
+_REQUIRED_FIELDS = {
+    grant_type: (fields, attrgetter(*fields))
+    for grant_type, fields in {
+        'client_credentials': _BASE_REQUIRED_FIELDS + ('OSDU_CLIENT_SECRET',),
+        'password': _BASE_REQUIRED_FIELDS + ('OSDU_USERNAME', 'OSDU_PASSWORD'),
+    }.items()
+}
+
+
+@lru_cache(maxsize=1)
+def _load_env(env_path: Path, mtime: float) -> None:
+    """Parse .env into os.environ once per file version (mtime is the cache key).
+
+    load_dotenv does not override, so an edited .env only adds keys that are not
+    already set; changed values need a restart, as before this cache existed.
+    """
+    load_dotenv(env_path)
 
 
 class Config:
+    # Fixed attribute set: slots drop the per-instance __dict__ and make lookups
+    # slot descriptors. Not frozen, since apply_runtime_overrides updates values.
+    __slots__ = (
+        'OSDU_BASE_URL', 'OSDU_BASE_HOST', 'OSDU_PARTITION_ID',
+        'OSDU_ENTITLEMENTS_BASE_PATH', 'OSDU_LEGAL_BASE_PATH', 'OSDU_PARTITION_BASE_PATH',
+        'OSDU_STORAGE_BASE_PATH', 'OSDU_TIMEOUT_SECONDS', 'OSDU_GROUP_SCAN_LIMIT',
+        'OSDU_MAX_PAGE_SIZE', 'OSDU_TOKEN_ENDPOINT', 'OSDU_AUTH_BASE_URL', 'OSDU_AUTH_REALM',
+        'OSDU_TOKEN_HOST', 'OSDU_TOKEN_GRANT_TYPE', 'OSDU_CLIENT_ID', 'OSDU_CLIENT_SECRET',
+        'OSDU_REFRESH_TOKEN', 'OSDU_SHARED_ACCESS_TOKEN', 'OSDU_USERNAME', 'OSDU_PASSWORD',
+        'OSDU_EXTERNAL_ADMIN_USERNAME', 'OSDU_EXTERNAL_ADMIN_PASSWORD', 'OSDU_TOKEN_SCOPE',
+        'OSDU_VERIFY_SSL', 'OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS',
+        'FLASK_ENV', 'FLASK_DEBUG', 'FLASK_HOST', 'FLASK_PORT',
+        '_to_dict_view', '_flask_config_view',
+    )
+
     def __init__(self):
+        self._to_dict_view = None
+        self._flask_config_view = None
+
         # Load environment variables from .env file
-        env_path = Path(__file__).parent / '.env'
-        load_dotenv(env_path)
+        try:
+            env_mtime = _ENV_PATH.stat().st_mtime
+        except OSError:
+            env_mtime = 0.0
+        _load_env(_ENV_PATH, env_mtime)
+        env = os.environ  # bound once; every setting below is a plain mapping lookup
         
         # OSDU Core Configuration
         self.OSDU_BASE_URL = self._first_env(
+            env,
             'OSDU_BASE_URL',
             'OSDU_EXTERNAL_BASE_URL',
             default=''
         ).rstrip('/')
-        self.OSDU_BASE_HOST = os.getenv('OSDU_BASE_HOST')  # Optional Host header bypass
+        self.OSDU_BASE_HOST = env.get('OSDU_BASE_HOST')  # Optional Host header bypass
         self.OSDU_PARTITION_ID = self._first_env(
+            env,
             'OSDU_PARTITION_ID',
             'OSDU_DATA_PARTITION_ID',
             'OSDU_PARTITION',
@@ -25,48 +77,51 @@ class Config:
         )
 
         # OSDU service paths
-        self.OSDU_ENTITLEMENTS_BASE_PATH = os.getenv('OSDU_ENTITLEMENTS_BASE_PATH', '/api/entitlements/v2')
-        self.OSDU_LEGAL_BASE_PATH = os.getenv('OSDU_LEGAL_BASE_PATH', '/api/legal/v1')
-        self.OSDU_PARTITION_BASE_PATH = os.getenv('OSDU_PARTITION_BASE_PATH', '/api/partition/v1')
-        self.OSDU_STORAGE_BASE_PATH = os.getenv('OSDU_STORAGE_BASE_PATH', '/api/storage/v2')
-        self.OSDU_TIMEOUT_SECONDS = int(os.getenv('OSDU_TIMEOUT_SECONDS', '30'))
-        self.OSDU_GROUP_SCAN_LIMIT = int(os.getenv('OSDU_GROUP_SCAN_LIMIT', '5000'))
-        self.OSDU_MAX_PAGE_SIZE = int(os.getenv('OSDU_MAX_PAGE_SIZE', '100'))
+        self.OSDU_ENTITLEMENTS_BASE_PATH = env.get('OSDU_ENTITLEMENTS_BASE_PATH', '/api/entitlements/v2')
+        self.OSDU_LEGAL_BASE_PATH = env.get('OSDU_LEGAL_BASE_PATH', '/api/legal/v1')
+        self.OSDU_PARTITION_BASE_PATH = env.get('OSDU_PARTITION_BASE_PATH', '/api/partition/v1')
+        self.OSDU_STORAGE_BASE_PATH = env.get('OSDU_STORAGE_BASE_PATH', '/api/storage/v2')
+        self.OSDU_TIMEOUT_SECONDS = int(env.get('OSDU_TIMEOUT_SECONDS', '30'))
+        self.OSDU_GROUP_SCAN_LIMIT = int(env.get('OSDU_GROUP_SCAN_LIMIT', '5000'))
+        self.OSDU_MAX_PAGE_SIZE = int(env.get('OSDU_MAX_PAGE_SIZE', '100'))
 
         # Token Configuration
         self.OSDU_TOKEN_ENDPOINT = self._first_env(
+            env,
             'OSDU_TOKEN_ENDPOINT',
             'OSDU_AUTH_URL',
             'OSDU_EXTERNAL_TOKEN_URL',
             'OSDU_EXTERNAL_AUTH_URL'
         )
-        self.OSDU_AUTH_BASE_URL = self._first_env('OSDU_AUTH_BASE_URL', 'OSDU_EXTERNAL_AUTH_URL', default='')
-        self.OSDU_AUTH_REALM = self._first_env('OSDU_AUTH_REALM', 'OSDU_EXTERNAL_REALM', default='')
+        self.OSDU_AUTH_BASE_URL = self._first_env(env, 'OSDU_AUTH_BASE_URL', 'OSDU_EXTERNAL_AUTH_URL', default='')
+        self.OSDU_AUTH_REALM = self._first_env(env, 'OSDU_AUTH_REALM', 'OSDU_EXTERNAL_REALM', default='')
         self._derive_keycloak_admin_config()
-        self.OSDU_TOKEN_HOST = os.getenv('OSDU_TOKEN_HOST')  # Optional Host header bypass
-        self.OSDU_TOKEN_GRANT_TYPE = os.getenv('OSDU_TOKEN_GRANT_TYPE', 'client_credentials').strip().lower()
-        self.OSDU_CLIENT_ID = self._first_env('OSDU_CLIENT_ID', 'OSDU_EXTERNAL_CLIENT_ID')
-        self.OSDU_CLIENT_SECRET = self._first_env('OSDU_CLIENT_SECRET', 'OSDU_EXTERNAL_CLIENT_SECRET', default='')
-        self.OSDU_REFRESH_TOKEN = self._first_env('OSDU_REFRESH_TOKEN', 'OSDU_EXTERNAL_REFRESH_TOKEN', default='')
-        self.OSDU_SHARED_ACCESS_TOKEN = os.getenv('OSDU_SHARED_ACCESS_TOKEN', '')
-        self.OSDU_USERNAME = self._first_env('OSDU_USERNAME', 'OSDU_EXTERNAL_USERNAME', default='')
-        self.OSDU_PASSWORD = self._first_env('OSDU_PASSWORD', 'OSDU_EXTERNAL_PASSWORD', default='')
-        self.OSDU_EXTERNAL_ADMIN_USERNAME = os.getenv('OSDU_EXTERNAL_ADMIN_USERNAME', '')
-        self.OSDU_EXTERNAL_ADMIN_PASSWORD = os.getenv('OSDU_EXTERNAL_ADMIN_PASSWORD', '')
-        self.OSDU_TOKEN_SCOPE = os.getenv('OSDU_TOKEN_SCOPE', 'openid profile email')
-        self.OSDU_VERIFY_SSL = self._first_env('OSDU_VERIFY_SSL', 'OSDU_EXTERNAL_VERIFY_SSL', default='False')
-        self.OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS = int(os.getenv('OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS', '3600'))
+        self.OSDU_TOKEN_HOST = env.get('OSDU_TOKEN_HOST')  # Optional Host header bypass
+        self.OSDU_TOKEN_GRANT_TYPE = env.get('OSDU_TOKEN_GRANT_TYPE', 'client_credentials').strip().lower()
+        self.OSDU_CLIENT_ID = self._first_env(env, 'OSDU_CLIENT_ID', 'OSDU_EXTERNAL_CLIENT_ID')
+        self.OSDU_CLIENT_SECRET = self._first_env(env, 'OSDU_CLIENT_SECRET', 'OSDU_EXTERNAL_CLIENT_SECRET', default='')
+        self.OSDU_REFRESH_TOKEN = self._first_env(env, 'OSDU_REFRESH_TOKEN', 'OSDU_EXTERNAL_REFRESH_TOKEN', default='')
+        self.OSDU_SHARED_ACCESS_TOKEN = env.get('OSDU_SHARED_ACCESS_TOKEN', '')
+        self.OSDU_USERNAME = self._first_env(env, 'OSDU_USERNAME', 'OSDU_EXTERNAL_USERNAME', default='')
+        self.OSDU_PASSWORD = self._first_env(env, 'OSDU_PASSWORD', 'OSDU_EXTERNAL_PASSWORD', default='')
+        self.OSDU_EXTERNAL_ADMIN_USERNAME = env.get('OSDU_EXTERNAL_ADMIN_USERNAME', '')
+        self.OSDU_EXTERNAL_ADMIN_PASSWORD = env.get('OSDU_EXTERNAL_ADMIN_PASSWORD', '')
+        self.OSDU_TOKEN_SCOPE = env.get('OSDU_TOKEN_SCOPE', 'openid profile email')
+        self.OSDU_VERIFY_SSL = self.as_bool(
+            self._first_env(env, 'OSDU_VERIFY_SSL', 'OSDU_EXTERNAL_VERIFY_SSL', default='False')
+        )
+        self.OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS = int(env.get('OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS', '3600'))
         
         # Flask Configuration
-        self.FLASK_ENV = os.getenv('FLASK_ENV', 'development')
-        self.FLASK_DEBUG = self.as_bool(os.getenv('FLASK_DEBUG', 'False'))
-        self.FLASK_HOST = os.getenv('FLASK_HOST', '0.0.0.0')
-        self.FLASK_PORT = int(os.getenv('FLASK_PORT', 5000))
+        self.FLASK_ENV = env.get('FLASK_ENV', 'development')
+        self.FLASK_DEBUG = self.as_bool(env.get('FLASK_DEBUG', 'False'))
+        self.FLASK_HOST = env.get('FLASK_HOST', '0.0.0.0')
+        self.FLASK_PORT = int(env.get('FLASK_PORT', 5000))
 
     @staticmethod
-    def _first_env(*names, default=None):
+    def _first_env(env, *names, default=None):
         for name in names:
-            value = os.getenv(name)
+            value = env.get(name)
             if value not in (None, ''):
                 return value
         return default
@@ -95,7 +150,7 @@ class Config:
 
     @staticmethod
     def as_bool(value: str) -> bool:
-        return str(value).strip().lower() in ('1', 'true', 'yes', 'y', 'on')
+        return str(value).strip().lower() in _TRUE_VALUES
 
     def is_configured(self):
         """Return True when the current auth mode has enough config to request a token."""
@@ -166,12 +221,20 @@ class Config:
                     continue
             if key in int_fields:
                 value = int(value) if str(value).strip() else getattr(self, key)
+            if key == 'OSDU_VERIFY_SSL':
+                value = self.as_bool(value)
             if key == 'OSDU_BASE_URL' and isinstance(value, str):
                 value = value.rstrip('/')
             if key == 'OSDU_TOKEN_GRANT_TYPE' and isinstance(value, str):
                 value = value.lower()
             setattr(self, key, value)
         self._derive_keycloak_admin_config()
+        self._reset_cached_views()
+
+    def _reset_cached_views(self):
+        """Drop the memoized to_dict/get_flask_config views after a config change."""
+        self._to_dict_view = None
+        self._flask_config_view = None
 
     def auth_form_defaults(self):
         """Return values safe to prefill in the Environment & Auth screen."""
@@ -193,9 +256,15 @@ class Config:
             'OSDU_PASSWORD': '',
         }
 
+    @property
     def to_dict(self):
-        """Convert config to dictionary for TokenManager"""
-        return {
+        """Read-only mapping of the config for TokenManager"""
+        if self._to_dict_view is None:
+            self._to_dict_view = self._build_token_config()
+        return self._to_dict_view
+
+    def _build_token_config(self):
+        return MappingProxyType({
             'OSDU_BASE_URL': self.OSDU_BASE_URL,
             'OSDU_BASE_HOST': self.OSDU_BASE_HOST,
             'OSDU_PARTITION_ID': self.OSDU_PARTITION_ID,
@@ -213,39 +282,35 @@ class Config:
             'OSDU_TOKEN_SCOPE': self.OSDU_TOKEN_SCOPE,
             'OSDU_VERIFY_SSL': self.OSDU_VERIFY_SSL,
             'OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS': self.OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS
-        }
+        })
 
     def validate(self):
         """Validate required configuration"""
-        required_fields = ['OSDU_BASE_URL', 'OSDU_PARTITION_ID', 'OSDU_TOKEN_ENDPOINT', 'OSDU_CLIENT_ID']
-
-        if self.OSDU_TOKEN_GRANT_TYPE == 'client_credentials':
-            required_fields.append('OSDU_CLIENT_SECRET')
-        elif self.OSDU_TOKEN_GRANT_TYPE == 'password':
-            required_fields.extend(['OSDU_USERNAME', 'OSDU_PASSWORD'])
-        else:
+        try:
+            required_fields, getter = _REQUIRED_FIELDS[self.OSDU_TOKEN_GRANT_TYPE]
+        except KeyError:
             raise ValueError(
                 "OSDU_TOKEN_GRANT_TYPE must be 'client_credentials' or 'password'"
-            )
+            ) from None
         
-        missing = []
-        for field in required_fields:
-            if not getattr(self, field):
-                missing.append(field)
+        missing = [field for field, value in zip(required_fields, getter(self)) if not value]
         
         if missing:
             raise ValueError(f"Missing required configuration: {', '.join(missing)}")
         
         return True
 
+    @property
     def get_flask_config(self):
-        """Get Flask configuration"""
-        return {
-            'ENV': self.FLASK_ENV,
-            'DEBUG': self.FLASK_DEBUG,
-            'HOST': self.FLASK_HOST,
-            'PORT': self.FLASK_PORT
-        }
+        """Read-only mapping of the Flask configuration"""
+        if self._flask_config_view is None:
+            self._flask_config_view = MappingProxyType({
+                'ENV': self.FLASK_ENV,
+                'DEBUG': self.FLASK_DEBUG,
+                'HOST': self.FLASK_HOST,
+                'PORT': self.FLASK_PORT
+            })
+        return self._flask_config_view
 
     def public_summary(self):
         """Return a UI-safe config summary without secrets."""
@@ -260,7 +325,7 @@ class Config:
             'client_id': self.OSDU_CLIENT_ID,
             'client_secret': self._mask(self.OSDU_CLIENT_SECRET),
             'username': self.OSDU_USERNAME,
-            'verify_ssl': self.as_bool(self.OSDU_VERIFY_SSL),
+            'verify_ssl': self.OSDU_VERIFY_SSL,
             'auth_base_url': self.OSDU_AUTH_BASE_URL,
             'auth_realm': self.OSDU_AUTH_REALM,
             'entitlements_path': self.OSDU_ENTITLEMENTS_BASE_PATH,
@@ -270,5 +335,7 @@ class Config:
         }
 
 
-# Global config instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, building it on first use."""
+    return Config()
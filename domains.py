@@ -1,6 +1,20 @@
 """Domain and Entity definitions for OSDU"""
+import sys
+from types import MappingProxyType
 
-DOMAINS = {
+
+def _freeze(value, key=None):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v, k) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v, key) for v in value)
+    if key in ('kind', 'kind_alternatives'):
+        return sys.intern(value)
+    return value
+
+
+DOMAINS = _freeze({
     "General Data": {
         "description": "Master data được nạp bởi general_data_ingestion_pipeline",
         "icon": "🏔️",
@@ -153,7 +167,7 @@ DOMAINS = {
             }
         }
     }
-}
+})
 
 
 def get_domain_list():
@@ -174,33 +188,72 @@ def get_entity_info(domain_name, entity_name):
     return None
 
 
-def get_all_entities():
-    """Get all entities across all domains"""
+def _build_all_entities():
     all_entities = {}
     for domain_name, domain_info in DOMAINS.items():
         for entity_name, entity_info in domain_info['entities'].items():
-            all_entities[f"{domain_name}.{entity_name}"] = {
+            all_entities[sys.intern(f"{domain_name}.{entity_name}")] = MappingProxyType({
                 "domain": domain_name,
                 "entity": entity_name,
                 **entity_info
-            }
-    return all_entities
+            })
+    return MappingProxyType(all_entities)
 
 
-def search_entities(search_term):
-    """Search for entities by name or description"""
-    results = []
-    search_lower = search_term.lower()
-    
+def _build_search_index():
+    search_index = []
     for domain_name, domain_info in DOMAINS.items():
         for entity_name, entity_info in domain_info['entities'].items():
-            if (search_lower in entity_name.lower() or 
-                search_lower in entity_info['description'].lower()):
-                results.append({
+            search_index.append((
+                entity_name.lower(),
+                entity_info['description'].lower(),
+                {
                     "domain": domain_name,
                     "entity": entity_name,
                     "kind": entity_info['kind'],
                     "description": entity_info['description']
-                })
-    
+                }
+            ))
+    return search_index
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _build_trigram_index(search_index):
+    """Map each 3-gram of an entity name/description to its _SEARCH_INDEX positions"""
+    trigram_index = {}
+    for position, (name_lower, description_lower, _) in enumerate(search_index):
+        for trigram in _trigrams(name_lower) | _trigrams(description_lower):
+            trigram_index.setdefault(trigram, set()).add(position)
+    return trigram_index
+
+
+# DOMAINS is a constant, so the flat views are built once at import
+_ALL_ENTITIES = _build_all_entities()
+_SEARCH_INDEX = _build_search_index()
+_TRIGRAM_INDEX = _build_trigram_index(_SEARCH_INDEX)
+
+
+def get_all_entities():
+    """Get all entities across all domains (read-only mapping)"""
+    return _ALL_ENTITIES
+
+
+def search_entities(search_term):
+    """Search for entities by name or description"""
+    search_lower = search_term.lower()
+    if len(search_lower) < 3:
+        candidates = range(len(_SEARCH_INDEX))
+    else:
+        # Narrow to entities containing every trigram of the term, then verify
+        postings = [_TRIGRAM_INDEX.get(trigram, set()) for trigram in _trigrams(search_lower)]
+        candidates = sorted(set.intersection(*postings))
+
+    results = []
+    for position in candidates:
+        name_lower, description_lower, record = _SEARCH_INDEX[position]
+        if search_lower in name_lower or search_lower in description_lower:
+            results.append(record)
     return results
\ No newline at end of file
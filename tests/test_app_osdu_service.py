@@ -0,0 +1,213 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import app
+from app import OSDUService
+from token_manager import TokenManager
+
+
+def ok(value, delay=0.0):
+    time.sleep(delay)
+    return {"results": [value]}
+
+
+def fail(delay=0.0):
+    time.sleep(delay)
+    return {"error": "failed", "results": []}
+
+
+def boom():
+    raise RuntimeError("boom")
+
+
+class FirstSuccessfulTests(unittest.TestCase):
+    def setUp(self):
+        self.service = OSDUService()
+
+    def test_primary_runs_on_calling_thread(self):
+        caller = threading.current_thread()
+        seen = []
+
+        def primary():
+            seen.append(threading.current_thread())
+            return ok("primary")
+
+        index, results = self.service._first_successful([(primary, ()), (ok, ("alt",))])
+        self.assertEqual(index, 0)
+        self.assertEqual(results[0], {"results": ["primary"]})
+        self.assertEqual(seen, [caller])
+
+    def test_priority_order_wins_over_completion_order(self):
+        for parallel in (True, False):
+            with self.subTest(parallel=parallel):
+                index, results = self.service._first_successful([
+                    (fail, (0.02,)),
+                    (ok, ("second", 0.05)),
+                    (ok, ("third",)),
+                ], parallel=parallel)
+                self.assertEqual(index, 1)
+                self.assertEqual(results[1], {"results": ["second"]})
+
+    def test_all_strategies_fail(self):
+        for parallel in (True, False):
+            with self.subTest(parallel=parallel):
+                index, results = self.service._first_successful(
+                    [(fail, ()), (fail, ()), (fail, ())], parallel=parallel
+                )
+                self.assertIsNone(index)
+                self.assertEqual(len(results), 3)
+                self.assertTrue(all(result.get("error") for result in results))
+
+    def test_exceptions_are_captured_as_errors(self):
+        for parallel in (True, False):
+            with self.subTest(parallel=parallel):
+                index, results = self.service._first_successful(
+                    [(boom, ()), (boom, ()), (ok, ("last",))], parallel=parallel
+                )
+                self.assertEqual(index, 2)
+                self.assertEqual(results[0], {"error": "boom"})
+                self.assertEqual(results[1], {"error": "boom"})
+
+
+class HeaderTests(unittest.TestCase):
+    def test_headers_do_not_touch_the_shared_session(self):
+        session_headers = dict(app._session.headers)
+        token_manager = mock.Mock(get_token=mock.Mock(return_value="token-1"))
+        with mock.patch.object(app, "token_manager", token_manager):
+            service = OSDUService()
+            headers = service.get_headers()
+            self.assertIs(service.get_headers(), headers)
+            plain = service.get_headers(accept_json=False)
+
+        self.assertEqual(dict(app._session.headers), session_headers)
+        self.assertEqual(headers["Authorization"], "Bearer token-1")
+        self.assertEqual(headers["data-partition-id"], service.partition_id)
+        self.assertEqual(headers["Accept"], "application/json")
+        self.assertNotIn("Accept", plain)
+        with self.assertRaises(TypeError):
+            headers["Authorization"] = "other"
+
+
+class RequestRetryTests(unittest.TestCase):
+    def test_late_401s_share_one_token_refresh(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        manager = TokenManager({
+            "OSDU_TOKEN_ENDPOINT": "https://keycloak.example.com/token",
+            "OSDU_CLIENT_ID": "osdu-viewer",
+            "OSDU_CLIENT_SECRET": "secret",
+        })
+        manager._cache_file = os.path.join(tmp_dir.name, ".token_cache")
+        manager._process_token_response({"access_token": "revoked", "expires_in": 3600})
+        token_requests = []
+
+        def request_new_token():
+            token_requests.append(1)
+            return manager._process_token_response({"access_token": "fresh", "expires_in": 3600})
+
+        # All four strategies send the revoked token before any 401 comes back
+        barrier = threading.Barrier(4)
+
+        def send(method, url, headers, **kwargs):
+            if headers["Authorization"] == "Bearer revoked":
+                barrier.wait(5)
+                return mock.Mock(status_code=401)
+            return mock.Mock(status_code=200)
+
+        with mock.patch.object(app, "token_manager", manager), \
+                mock.patch.object(manager, "_request_new_token", side_effect=request_new_token):
+            service = OSDUService()
+            service.session = mock.Mock(request=mock.Mock(side_effect=send))
+            responses = []
+            threads = [
+                threading.Thread(target=lambda: responses.append(service._request("POST", "https://osdu.example.com/q")))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(token_requests), 1)
+        self.assertEqual([response.status_code for response in responses], [200] * 4)
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_read_posts_retry_on_5xx_but_deletes_do_not(self):
+        read_retry = app._session.get_adapter("https://osdu.example.com").max_retries
+        write_retry = app._write_session.get_adapter("https://osdu.example.com").max_retries
+        for status in (502, 503, 504):
+            self.assertTrue(read_retry.is_retry("POST", status))
+            self.assertFalse(write_retry.is_retry("POST", status))
+        # Connection failures (the request never reached OSDU) are still retried
+        self.assertEqual(write_retry.total, 3)
+        self.assertIsNone(write_retry.connect)
+
+    def test_delete_uses_the_write_session(self):
+        token_manager = mock.Mock(get_token=mock.Mock(return_value="token-1"))
+        with mock.patch.object(app, "token_manager", token_manager):
+            service = OSDUService()
+            service.session = mock.Mock()
+            service.write_session = mock.Mock()
+            service.write_session.request.return_value = mock.Mock(status_code=204)
+            self.assertTrue(service.delete_record("osdu:wks:r1")["success"])
+        service.session.request.assert_not_called()
+        service.write_session.request.assert_called_once()
+
+
+class RecordsCacheTests(unittest.TestCase):
+    def setUp(self):
+        app.clear_records_cache()
+        self.addCleanup(app.clear_records_cache)
+
+    def test_entries_expire_after_ttl(self):
+        with mock.patch("app.time.time", return_value=1000.0):
+            app.cache_records("key", {"results": []})
+        with mock.patch("app.time.time", return_value=1000.0 + app.RECORDS_CACHE_TTL - 1):
+            self.assertEqual(app.get_cached_records("key"), {"results": []})
+        with mock.patch("app.time.time", return_value=1000.0 + app.RECORDS_CACHE_TTL):
+            self.assertIsNone(app.get_cached_records("key"))
+        self.assertNotIn("key", app.records_cache)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        with mock.patch.object(app, "RECORDS_CACHE_MAXSIZE", 2):
+            app.cache_records("a", {"results": ["a"]})
+            app.cache_records("b", {"results": ["b"]})
+            app.get_cached_records("a")
+            app.cache_records("c", {"results": ["c"]})
+        self.assertEqual(list(app.records_cache), ["a", "c"])
+
+    def test_api_records_cache_key_and_nocache(self):
+        service = mock.Mock(partition_id="osdu", base_url="https://osdu.example.com")
+        service.search_records.return_value = {"results": [{"id": "r1"}]}
+        other_partition = mock.Mock(partition_id="other", base_url="https://osdu.example.com")
+        other_partition.search_records.return_value = {"results": [{"id": "r2"}]}
+        client = app.app.test_client()
+        url = "/api/records/General%20Data/Basin"
+
+        with mock.patch.object(app, "osdu_auth_ready", return_value=True):
+            with mock.patch.object(app, "osdu_service", service):
+                first = client.get(url)
+                self.assertEqual(first.status_code, 200)
+                # One encoded body (not a chunked generator) carries a Content-Length
+                self.assertEqual(int(first.headers["Content-Length"]), len(first.data))
+                self.assertEqual(first.get_json()["results"], [{"id": "r1"}])
+                self.assertEqual(client.get(url).status_code, 200)
+                self.assertEqual(service.search_records.call_count, 1)
+                client.get(url + "?nocache=1")
+                self.assertEqual(service.search_records.call_count, 2)
+            with mock.patch.object(app, "osdu_service", other_partition):
+                body = client.get(url).get_json()
+        self.assertEqual(body["results"], [{"id": "r2"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from config import Config
+
+
+class ConfigViewTests(unittest.TestCase):
+    def test_views_are_cached_and_read_only(self):
+        config = Config()
+        self.assertIs(config.to_dict, config.to_dict)
+        self.assertIs(config.get_flask_config, config.get_flask_config)
+        with self.assertRaises(TypeError):
+            config.to_dict["OSDU_BASE_URL"] = "https://other.example.com"
+
+    def test_runtime_overrides_refresh_views(self):
+        config = Config()
+        before = config.to_dict
+        config.apply_runtime_overrides({"OSDU_BASE_URL": "https://osdu.example.com/"})
+        self.assertIsNot(config.to_dict, before)
+        self.assertEqual(config.to_dict["OSDU_BASE_URL"], "https://osdu.example.com")
+
+    def test_verify_ssl_is_coerced_to_bool(self):
+        config = Config()
+        self.assertIsInstance(config.OSDU_VERIFY_SSL, bool)
+        config.apply_runtime_overrides({"OSDU_VERIFY_SSL": "true"})
+        self.assertIs(config.OSDU_VERIFY_SSL, True)
+        self.assertIs(config.to_dict["OSDU_VERIFY_SSL"], True)
+
+
+if __name__ == "__main__":
+    unittest.main()
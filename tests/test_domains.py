@@ -0,0 +1,55 @@
+import os
+import sys
+import unittest
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from domains import DOMAINS, get_all_entities, search_entities
+
+
+class DomainRegistryTests(unittest.TestCase):
+    def test_get_all_entities(self):
+        all_entities = get_all_entities()
+        self.assertEqual(len(all_entities), sum(len(domain["entities"]) for domain in DOMAINS.values()))
+        basin = all_entities["General Data.Basin"]
+        self.assertEqual(basin["domain"], "General Data")
+        self.assertEqual(basin["entity"], "Basin")
+        self.assertEqual(basin["kind"], "osdu:wks:master-data--Basin:*")
+        with self.assertRaises(TypeError):
+            all_entities["General Data.Basin"] = {}
+        with self.assertRaises(TypeError):
+            basin["kind"] = "other"
+        self.assertIs(get_all_entities()["General Data.Basin"], basin)
+
+    def test_domains_are_read_only(self):
+        basin = DOMAINS["General Data"]["entities"]["Basin"]
+        self.assertIsInstance(basin["fields"], tuple)
+        self.assertIsInstance(basin["kind_alternatives"], tuple)
+        with self.assertRaises(TypeError):
+            DOMAINS["General Data"]["entities"]["Basin"] = {}
+
+    def test_search_entities(self):
+        entities = {record["entity"] for record in search_entities("WELLBORE")}
+        self.assertIn("Wellbore", entities)
+        self.assertNotIn("Basin", entities)
+        # Matches on description as well as on name
+        self.assertEqual([record["entity"] for record in search_entities("trầm tích")], ["Basin"])
+        self.assertEqual(search_entities("no-such-entity"), [])
+
+    def test_search_entities_matches_linear_scan(self):
+        def linear(term):
+            term = term.lower()
+            return [
+                record["entity"]
+                for record in search_entities("")
+                if term in record["entity"].lower() or term in record["description"].lower()
+            ]
+
+        for term in ("w", "lo", "log", "Well Log", "survey", "seismic", "tầng", "zzz"):
+            with self.subTest(term=term):
+                self.assertEqual([record["entity"] for record in search_entities(term)], linear(term))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from token_manager import TokenError, TokenManager, get_token_manager
+
+
+def make_manager(cache_file: str) -> TokenManager:
+    manager = TokenManager({
+        "OSDU_TOKEN_ENDPOINT": "https://keycloak.example.com/realms/osdu/protocol/openid-connect/token",
+        "OSDU_CLIENT_ID": "osdu-viewer",
+        "OSDU_CLIENT_SECRET": "secret",
+    })
+    manager._cache_file = cache_file
+    return manager
+
+
+class TokenCacheFileTests(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_file = os.path.join(tmp_dir.name, ".token_cache")
+
+    def test_cache_round_trip(self):
+        expiry = time.time() + 3600
+        make_manager(self.cache_file)._save_to_cache("token-1", expiry)
+
+        manager = make_manager(self.cache_file)
+        self.assertTrue(manager._load_from_cache())
+        self.assertEqual(manager._cached_token, "token-1")
+        self.assertEqual(manager._token_expiry, expiry)
+
+    def test_unchanged_cache_file_is_not_reread(self):
+        make_manager(self.cache_file)._save_to_cache("token-1", time.time() + 3600)
+        manager = make_manager(self.cache_file)
+        self.assertTrue(manager._load_from_cache())
+
+        with mock.patch("builtins.open", side_effect=AssertionError("cache file re-read")):
+            self.assertTrue(manager._load_from_cache())
+
+    def test_cache_file_is_written_atomically_and_private(self):
+        make_manager(self.cache_file)._save_to_cache("token-1", time.time() + 3600)
+        self.assertEqual(os.listdir(os.path.dirname(self.cache_file)), [".token_cache"])
+        if os.name == "posix":
+            self.assertEqual(os.stat(self.cache_file).st_mode & 0o777, 0o600)
+
+    def test_failed_cache_write_removes_temp_file(self):
+        manager = make_manager(self.cache_file)
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            manager._save_to_cache("token-1", time.time() + 3600)
+        self.assertEqual(os.listdir(os.path.dirname(self.cache_file)), [])
+
+    def test_identical_token_is_not_rewritten(self):
+        manager = make_manager(self.cache_file)
+        manager._process_token_response({"access_token": "token-1", "expires_in": 3600})
+        expiry = manager._token_expiry
+        time.sleep(0.01)
+        with mock.patch.object(manager, "_save_to_cache") as save:
+            manager._process_token_response({"access_token": "token-1", "expires_in": 3600})
+            save.assert_not_called()
+            self.assertEqual(manager._token_expiry, expiry)
+            manager._process_token_response({"access_token": "token-2", "expires_in": 3600})
+            save.assert_called_once()
+
+    def test_missing_access_token_raises_token_error(self):
+        with self.assertRaises(TokenError):
+            make_manager(self.cache_file)._process_token_response({})
+
+    def test_invalidate_only_clears_the_current_token(self):
+        manager = make_manager(self.cache_file)
+        manager._process_token_response({"access_token": "token-1", "expires_in": 3600})
+        manager._process_token_response({"access_token": "token-2", "expires_in": 3600})
+
+        self.assertFalse(manager.invalidate("token-1"))
+        self.assertEqual(manager._cached_token, "token-2")
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        self.assertTrue(manager.invalidate("token-2"))
+        self.assertIsNone(manager._cached_token)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_missing_cache_file(self):
+        self.assertFalse(make_manager(self.cache_file)._load_from_cache())
+
+
+class TokenRequestTests(unittest.TestCase):
+    def test_verify_ssl_is_passed_per_request(self):
+        manager = TokenManager({
+            "OSDU_TOKEN_ENDPOINT": "https://keycloak.example.com/token",
+            "OSDU_CLIENT_ID": "osdu-viewer",
+            "OSDU_VERIFY_SSL": "False",
+        })
+        with mock.patch.object(manager, "_get_session") as get_session:
+            manager._post_token_request({"grant_type": "client_credentials"})
+        get_session.return_value.post.assert_called_once_with(
+            "https://keycloak.example.com/token", data={"grant_type": "client_credentials"}, verify=False
+        )
+
+
+class TokenManagerSingletonTests(unittest.TestCase):
+    CONFIG = {
+        "OSDU_TOKEN_ENDPOINT": "https://keycloak.example.com/realms/osdu/protocol/openid-connect/token",
+        "OSDU_CLIENT_ID": "osdu-viewer",
+        "OSDU_CLIENT_SECRET": "secret",
+    }
+
+    def test_same_config_reuses_instance(self):
+        first = get_token_manager(dict(self.CONFIG))
+        self.assertIs(get_token_manager(dict(self.CONFIG)), first)
+        self.assertIsNot(get_token_manager({**self.CONFIG, "OSDU_CLIENT_ID": "other"}), first)
+
+    def test_restart_after_timed_out_stop_keeps_loop_running(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        manager = make_manager(os.path.join(tmp_dir.name, ".token_cache"))
+        in_request = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_request():
+            calls.append(1)
+            in_request.set()
+            release.wait(5)
+            return manager._process_token_response({"access_token": "token-1", "expires_in": 0})
+
+        with mock.patch.object(manager, "_request_new_token", side_effect=slow_request):
+            manager.start_background_refresh(interval=0)
+            self.assertTrue(in_request.wait(5))
+            with mock.patch.object(manager._refresh_thread, "join"):
+                manager.stop_background_refresh()  # join "times out" mid-request
+            thread = manager._refresh_thread
+            manager.start_background_refresh(interval=0)
+            self.assertIs(manager._refresh_thread, thread)
+            release.set()
+            deadline = time.time() + 5
+            while len(calls) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(thread.is_alive())
+            manager.stop_background_refresh()
+
+        self.assertGreaterEqual(len(calls), 2)
+
+    def test_concurrent_callers_share_one_token_request(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        manager = make_manager(os.path.join(tmp_dir.name, ".token_cache"))
+        calls = []
+
+        def fake_request():
+            calls.append(1)
+            time.sleep(0.05)
+            return manager._process_token_response({"access_token": "token-1", "expires_in": 3600})
+
+        with mock.patch.object(manager, "_request_new_token", side_effect=fake_request):
+            threads = [threading.Thread(target=manager.get_token) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(manager.get_token(), "token-1")
+
+    def test_concurrent_awaiters_share_one_token_request(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        manager = make_manager(os.path.join(tmp_dir.name, ".token_cache"))
+        calls = []
+
+        def fake_request():
+            calls.append(1)
+            time.sleep(0.05)
+            return manager._process_token_response({"access_token": "token-1", "expires_in": 3600})
+
+        async def fetch_all():
+            return await asyncio.gather(*(manager.aget_token() for _ in range(5)))
+
+        with mock.patch.object(manager, "_request_new_token", side_effect=fake_request):
+            tokens = asyncio.run(fetch_all())
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(tokens, ["token-1"] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
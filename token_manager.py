@@ -1,17 +1,29 @@
 """Token Manager for OSDU API - Simplified for Web App"""
 import logging
 import time
-import requests
 import json
+import orjson
 import os
 import threading
 from typing import Optional, Dict
 
+# requests is imported when the token HTTP session is first created: serving
+# a cached token never needs it, so importing this module stays cheap.
+
 logger = logging.getLogger(__name__)
 
+_INSTANCE: Optional['TokenManager'] = None
+_LOCK = threading.Lock()
+
+
+class TokenError(RuntimeError):
+    """Raised when an access token cannot be obtained"""
+    __slots__ = ()
+
 
 class TokenManager:
     def __init__(self, config: Dict):
+        self.source_config = dict(config)
         self.token_endpoint = config.get('OSDU_TOKEN_ENDPOINT')
         self.token_host = config.get('OSDU_TOKEN_HOST')
         self.grant_type = str(config.get('OSDU_TOKEN_GRANT_TYPE', 'client_credentials')).strip().lower()
@@ -23,7 +35,8 @@ class TokenManager:
         self.scope = config.get('OSDU_TOKEN_SCOPE', 'openid profile email')
         self.default_expires_seconds = int(config.get('OSDU_TOKEN_DEFAULT_EXPIRES_SECONDS', 3600))
         self.shared_access_token = config.get('OSDU_SHARED_ACCESS_TOKEN', '')
-        self.verify_ssl = self._as_bool(config.get('OSDU_VERIFY_SSL', 'False'))
+        # Config hands over a bool; plain dicts may still carry the raw string
+        self.verify_ssl = self._as_bool(config.get('OSDU_VERIFY_SSL', False))
         self._cache_identity = {
             'token_endpoint': self.token_endpoint,
             'grant_type': self.grant_type,
@@ -34,12 +47,40 @@ class TokenManager:
         self._cached_token = None
         self._token_expiry = 0
         self._cache_file = os.path.join(os.path.dirname(__file__), '.token_cache')
+        self._cache_file_state = None  # (mtime, loaded) of the last cache file read
+        self._last_saved = None  # (token, expiry) known to be on disk
         self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()  # single-flight for token HTTP requests
         self._refresh_thread = None
         self._stop_refresh = False
+        self._session = None
 
     def get_token(self) -> str:
         """Get valid access token, refresh if needed"""
+        token = self._get_cached_token()
+        if token:
+            return token
+
+        with self._refresh_lock:
+            # Another thread may have refreshed the token while we waited
+            token = self._get_cached_token()
+            if token:
+                return token
+            return self._request_new_token()
+
+    async def aget_token(self) -> str:
+        """Async variant of get_token for callers already running an event loop"""
+        import asyncio  # already loaded by the running loop; kept off module import
+
+        token = self._get_cached_token()
+        if token:
+            return token
+        # The refresh runs on a worker thread; get_token's single-flight lock
+        # lets concurrent awaiters share one HTTP request
+        return await asyncio.to_thread(self.get_token)
+
+    def _get_cached_token(self) -> Optional[str]:
+        """Return a still-valid token from env, memory or the cache file"""
         with self._lock:
             shared_token = self._read_shared_access_token()
             if shared_token:
@@ -52,54 +93,107 @@ class TokenManager:
                 if time.time() < self._token_expiry - 300:
                     return self._cached_token
             
-            return self._request_new_token()
+            return None
 
     def _load_from_cache(self) -> bool:
-        """Load token from cache file"""
+        """Load token from cache file, skipping the read while its mtime is unchanged"""
         try:
-            if os.path.exists(self._cache_file):
-                with open(self._cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    if cache_data.get('source') != self._cache_identity:
-                        return False
+            mtime = os.stat(self._cache_file).st_mtime_ns
+        except OSError:
+            self._cache_file_state = None
+            return False
+
+        if self._cache_file_state and self._cache_file_state[0] == mtime:
+            return self._cache_file_state[1]
+
+        loaded = False
+        try:
+            with open(self._cache_file, 'rb') as f:
+                cache_data = orjson.loads(f.read())
+                if cache_data.get('source') == self._cache_identity:
                     self._cached_token = cache_data.get('access_token')
                     self._token_expiry = cache_data.get('expiry', 0)
-                    return True
+                    self._last_saved = (self._cached_token, self._token_expiry)
+                    loaded = True
         except Exception as e:
             logger.warning(f"Failed to load token cache: {e}")
-        return False
+        self._cache_file_state = (mtime, loaded)
+        return loaded
 
     def _save_to_cache(self, token: str, expiry: float):
-        """Save token to cache file"""
+        """Save token to cache file via a temp file and atomic replace"""
+        import tempfile  # only needed on the (rare) write path
+
+        tmp_file = None
         try:
-            cache_data = {
-                'access_token': token,
-                'expiry': expiry,
-                'cached_at': time.time(),
-                'source': self._cache_identity
-            }
-            with open(self._cache_file, 'w') as f:
-                json.dump(cache_data, f)
+            cache_data = {
+                'access_token': token,
+                'expiry': expiry,
+                'cached_at': time.time(),
+                'source': self._cache_identity
+            }
+            # A unique temp file per write (mode 0600: the cache holds a bearer
+            # token), so concurrent worker processes never share one
+            fd, tmp_file = tempfile.mkstemp(
+                prefix='.token_cache.', suffix='.tmp', dir=os.path.dirname(self._cache_file)
+            )
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(cache_data))
+            # Readers see either the old file or the complete new one, never a partial write
+            os.replace(tmp_file, self._cache_file)
+            tmp_file = None
+            self._last_saved = (token, expiry)
+            # Memory already holds what was just written; no need to re-read it
+            self._cache_file_state = (os.stat(self._cache_file).st_mtime_ns, True)
         except Exception as e:
             logger.warning(f"Failed to save token cache: {e}")
+            if tmp_file:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
 
+    def _get_session(self):
+        """Return the pooled HTTP session for token requests, creating it on first use"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers["Content-Type"] = "application/x-www-form-urlencoded"
+            # Host bypass for DNS resolution when the endpoint is an IP
+            if self.token_host:
+                session.headers["Host"] = self.token_host
+                logger.info(f"Using Host header: {self.token_host} for IP endpoint")
+            self._session = session
+        return self._session
+
+    def _post_token_request(self, payload: Dict):
+        """POST a token request on the pooled session"""
+        # verify is passed per call: a session-level value would be overridden
+        # by REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE, silently re-enabling verification
+        return self._get_session().post(self.token_endpoint, data=payload, verify=self.verify_ssl)
+
     def _request_new_token(self) -> str:
         """Request new access token"""
         if not self.token_endpoint or not self.client_id:
-            raise Exception("Missing required token configuration")
+            raise TokenError("Missing required token configuration")
 
         # Try refresh token first if available
         if self.refresh_token:
             try:
                 return self._request_with_refresh_token()
             except Exception as e:
-                logger.warning(f"Refresh token failed, trying client credentials: {e}")
+                logger.warning("Refresh token failed, trying client credentials: %s", e)
 
         if self.grant_type == 'password':
             return self._request_with_password_credentials()
         if self.grant_type == 'client_credentials':
             return self._request_with_client_credentials()
-        raise Exception("Unsupported OSDU_TOKEN_GRANT_TYPE. Use client_credentials or password")
+        raise TokenError("Unsupported OSDU_TOKEN_GRANT_TYPE. Use client_credentials or password")
 
     def _request_with_refresh_token(self) -> str:
         """Request token using refresh token"""
@@ -113,23 +207,12 @@ class TokenManager:
         if self.client_secret:
             payload["client_secret"] = self.client_secret
 
-        # Prepare headers with Host bypass for DNS resolution
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        if self.token_host:
-            headers["Host"] = self.token_host
-            logger.info(f"Using Host header: {self.token_host} for IP endpoint")
-
-        response = requests.post(
-            self.token_endpoint,
-            data=payload,
-            headers=headers,
-            verify=self.verify_ssl
-        )
+        response = self._post_token_request(payload)
 
         if response.status_code != 200:
-            logger.error(f"Refresh token request failed - Status: {response.status_code}")
-            logger.error(f"Response: {response.text}")
-            raise Exception(f"Refresh token request failed: {response.text}")
+            logger.error("Refresh token request failed - Status: %s", response.status_code)
+            logger.error("Response: %s", response.text)
+            raise TokenError(f"Refresh token request failed: {response.text}")
 
         token_data = response.json()
         
@@ -142,7 +225,7 @@ class TokenManager:
     def _request_with_client_credentials(self) -> str:
         """Request token using client credentials"""
         if not self.client_secret:
-            raise Exception("OSDU_CLIENT_SECRET is required for client_credentials grant")
+            raise TokenError("OSDU_CLIENT_SECRET is required for client_credentials grant")
 
         logger.info(f"Requesting token with client_credentials from: {self.token_endpoint}")
         
@@ -152,23 +235,12 @@ class TokenManager:
             "client_secret": self.client_secret
         }
 
-        # Prepare headers with Host bypass for DNS resolution
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        if self.token_host:
-            headers["Host"] = self.token_host
-            logger.info(f"Using Host header: {self.token_host} for IP endpoint")
-
-        response = requests.post(
-            self.token_endpoint,
-            data=payload,
-            headers=headers,
-            verify=self.verify_ssl
-        )
+        response = self._post_token_request(payload)
 
         if response.status_code != 200:
-            logger.error(f"Client credentials request failed - Status: {response.status_code}")
-            logger.error(f"Response: {response.text}")
-            raise Exception(f"Client credentials failed: {response.text}")
+            logger.error("Client credentials request failed - Status: %s", response.status_code)
+            logger.error("Response: %s", response.text)
+            raise TokenError(f"Client credentials failed: {response.text}")
 
         token_data = response.json()
         return self._process_token_response(token_data)
@@ -176,7 +248,7 @@ class TokenManager:
     def _request_with_password_credentials(self) -> str:
         """Request token using username/email and password."""
         if not self.username or not self.password:
-            raise Exception("OSDU_USERNAME and OSDU_PASSWORD are required for password grant")
+            raise TokenError("OSDU_USERNAME and OSDU_PASSWORD are required for password grant")
 
         logger.info(f"Requesting token with password grant from: {self.token_endpoint}")
 
@@ -190,22 +262,12 @@ class TokenManager:
         if self.client_secret:
             payload["client_secret"] = self.client_secret
 
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        if self.token_host:
-            headers["Host"] = self.token_host
-            logger.info(f"Using Host header: {self.token_host} for IP endpoint")
-
-        response = requests.post(
-            self.token_endpoint,
-            data=payload,
-            headers=headers,
-            verify=self.verify_ssl
-        )
+        response = self._post_token_request(payload)
 
         if response.status_code != 200:
-            logger.error(f"Password grant request failed - Status: {response.status_code}")
-            logger.error(f"Response: {response.text}")
-            raise Exception(f"Password grant failed: {response.text}")
+            logger.error("Password grant request failed - Status: %s", response.status_code)
+            logger.error("Response: %s", response.text)
+            raise TokenError(f"Password grant failed: {response.text}")
 
         token_data = response.json()
         if "refresh_token" in token_data:
@@ -216,14 +278,20 @@ class TokenManager:
         """Process token response and cache"""
         access_token = token_data.get("access_token")
         if not access_token:
-            raise Exception("No access token in response")
+            raise TokenError("No access token in response")
 
-        expires_in = token_data.get("expires_in", self.default_expires_seconds)
-        self._token_expiry = time.time() + int(expires_in)
-        self._cached_token = access_token
-
-        # Save to cache
-        self._save_to_cache(access_token, self._token_expiry)
+        last_saved = self._last_saved
+        if last_saved and last_saved[0] == access_token:
+            # The file already holds this token; keep its expiry and skip the write
+            with self._lock:
+                self._token_expiry = last_saved[1]
+                self._cached_token = access_token
+        else:
+            expires_in = token_data.get("expires_in", self.default_expires_seconds)
+            with self._lock:
+                self._token_expiry = time.time() + int(expires_in)
+                self._cached_token = access_token
+            self._save_to_cache(access_token, self._token_expiry)
 
         logger.info("Successfully obtained new access token")
         return access_token
@@ -232,12 +300,41 @@ class TokenManager:
         """Clear token cache"""
         self._cached_token = None
         self._token_expiry = 0
+        self._cache_file_state = None
+        self._last_saved = None
         try:
             if os.path.exists(self._cache_file):
                 os.remove(self._cache_file)
         except Exception as e:
             logger.warning(f"Failed to remove cache file: {e}")
 
+    def invalidate(self, token: str) -> bool:
+        """Drop ``token`` after the API rejected it, unless it was already replaced.
+
+        Concurrent requests can all get a 401 for the same token; only the first
+        one clears it, so later ones retry with the refreshed token instead of
+        wiping it and forcing another token request.
+        """
+        with self._lock:
+            if not token or token != self._cached_token:
+                return False
+            self._cached_token = None
+            self._token_expiry = 0
+            self._last_saved = None
+            try:
+                mtime = os.stat(self._cache_file).st_mtime_ns
+            except OSError:
+                mtime = None
+            # Only delete the file while it still holds the version we know about;
+            # a newer one may carry a token another process just fetched
+            if mtime is not None and self._cache_file_state and self._cache_file_state[0] == mtime:
+                try:
+                    os.remove(self._cache_file)
+                except OSError as e:
+                    logger.warning("Failed to remove cache file: %s", e)
+            self._cache_file_state = None
+            return True
+
     def is_token_valid(self) -> bool:
         """Check if current token is valid"""
         if self._read_shared_access_token():
@@ -264,10 +361,12 @@ class TokenManager:
 
     def start_background_refresh(self, interval: int = 3000):
         """Start background thread to refresh token periodically"""
+        # Reset first: a loop whose stop timed out mid-request keeps running
+        # instead of exiting after this call has seen it alive
+        self._stop_refresh = False
         if self._refresh_thread and self._refresh_thread.is_alive():
             return
         
-        self._stop_refresh = False
         self._refresh_thread = threading.Thread(
             target=self._background_refresh_loop,
             args=(interval,),
@@ -280,7 +379,7 @@ class TokenManager:
         """Background loop to refresh token"""
         while not self._stop_refresh:
             try:
-                with self._lock:
+                with self._refresh_lock:
                     if not self._cached_token or time.time() >= self._token_expiry - 600:
                         logger.info("Background refresh: requesting new token")
                         self._request_new_token()
@@ -310,3 +409,17 @@ class TokenManager:
         
         thread = threading.Thread(target=_fetch, daemon=True)
         thread.start()
+
+
+def get_token_manager(config: Dict) -> TokenManager:
+    """Return the process-wide TokenManager, rebuilding it only when config changes."""
+    global _INSTANCE
+    instance = _INSTANCE
+    if instance is not None and instance.source_config == config:
+        return instance
+    with _LOCK:
+        if _INSTANCE is None or _INSTANCE.source_config != config:
+            if _INSTANCE is not None:
+                _INSTANCE.stop_background_refresh()
+            _INSTANCE = TokenManager(config)
+        return _INSTANCE